@@ -0,0 +1,265 @@
+"""Command line tool for driving Binary Matrix 8x8 HDMI Switchers directly.
+
+Talks to one or more matrices concurrently without Home Assistant, e.g.::
+
+    python -m custom_components.binary_matrix.cli -p 123 query 192.168.4.200
+    python -m custom_components.binary_matrix.cli -p 123 route -r 1:2 hostA hostB
+    python -m custom_components.binary_matrix.cli -p 123 apply evening.json hostA
+
+Routing files are JSON objects mapping output numbers to input numbers,
+e.g. ``{"1": 2, "2": 5}``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .const import DEFAULT_PORT, DEFAULT_USERNAME, INPUT_RANGE, OUTPUT_RANGE
+from .matrix_controller import MatrixController, MatrixError
+
+ENV_PASSWORD = "BINARY_MATRIX_PASSWORD"
+DEFAULT_CONCURRENCY = 16
+
+
+def parse_host(value: str, default_port: int) -> Tuple[str, int]:
+    """Split ``host[:port]`` or ``[ipv6][:port]`` into host and port."""
+    if value.startswith("["):
+        host, sep, rest = value[1:].partition("]")
+        if not sep or not host or (rest and not rest.startswith(":")):
+            raise argparse.ArgumentTypeError(f"Invalid host {value!r}")
+        if not rest:
+            return host, default_port
+        port = rest[1:]
+    else:
+        host, sep, port = value.rpartition(":")
+        if not sep or ":" in host:
+            return value, default_port
+    try:
+        return host, int(port)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(f"Invalid port in {value!r}") from err
+
+
+def parse_route(value: str) -> Tuple[int, int]:
+    """Parse an ``OUTPUT:INPUT`` pair."""
+    try:
+        output, input_ = (int(part) for part in value.split(":"))
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(
+            f"Invalid route {value!r}, expected OUTPUT:INPUT"
+        ) from err
+    return validate_routing({output: input_}).popitem()
+
+
+def _route_number(value: Any) -> int:
+    """Return ``value`` as an output or input number, rejecting non-integers."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    raise ValueError(value)
+
+
+def validate_routing(routing: Dict[Any, Any]) -> Dict[int, int]:
+    """Return ``routing`` as an int -> int mapping, raising on bad entries."""
+    result: Dict[int, int] = {}
+    for output, input_ in routing.items():
+        try:
+            output, input_ = _route_number(output), _route_number(input_)
+        except ValueError as err:
+            raise argparse.ArgumentTypeError(
+                f"Invalid route {output!r} -> {input_!r}"
+            ) from err
+        if output not in OUTPUT_RANGE:
+            raise argparse.ArgumentTypeError(
+                f"Output {output} out of range, must be between "
+                f"{OUTPUT_RANGE.start} and {OUTPUT_RANGE.stop - 1}"
+            )
+        if input_ not in INPUT_RANGE:
+            raise argparse.ArgumentTypeError(
+                f"Input {input_} out of range, must be between "
+                f"{INPUT_RANGE.start} and {INPUT_RANGE.stop - 1}"
+            )
+        result[output] = input_
+    return result
+
+
+def load_routing_file(path: str) -> Dict[int, int]:
+    """Load a JSON routing file."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError) as err:
+        raise argparse.ArgumentTypeError(f"Cannot read {path}: {err}") from err
+    if not isinstance(data, dict) or not data:
+        raise argparse.ArgumentTypeError(
+            f"{path} must contain a non-empty JSON object of output -> input"
+        )
+    return validate_routing(data)
+
+
+async def run_host(
+    host: str,
+    port: int,
+    username: str,
+    password: str,
+    routing: Optional[Dict[int, int]],
+) -> Dict[int, int]:
+    """Connect to one matrix, optionally apply ``routing``, return its state.
+
+    Raises ``MatrixError`` if the matrix did not take every requested route.
+    """
+    matrix = MatrixController(
+        host=host,
+        port=port,
+        username=username,
+        password=password,
+    )
+    await matrix.connect()
+    try:
+        if routing is not None:
+            return await matrix.apply_routing(routing)
+        return matrix.state
+    finally:
+        await matrix.disconnect()
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run the selected command against every host and print the results."""
+    routing: Optional[Dict[int, int]] = None
+    if args.command == "route":
+        routing = dict(args.route)
+    elif args.command == "apply":
+        routing = args.file
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def _run(target: Tuple[str, int]) -> Dict[int, int]:
+        async with semaphore:
+            return await asyncio.wait_for(
+                run_host(*target, args.username, args.password, routing),
+                timeout=args.timeout,
+            )
+
+    results = await asyncio.gather(
+        *(_run(target) for target in args.hosts), return_exceptions=True
+    )
+
+    failed = False
+    report: Dict[str, Any] = {}
+    for (host, port), result in zip(args.hosts, results):
+        name = f"[{host}]" if ":" in host else host
+        if port != args.port:
+            name = f"{name}:{port}"
+        if isinstance(result, BaseException):
+            if not isinstance(result, (MatrixError, OSError, asyncio.TimeoutError)):
+                raise result
+            failed = True
+            report[name] = {"error": str(result) or type(result).__name__}
+        else:
+            report[name] = {
+                str(output): input_ for output, input_ in sorted(result.items())
+            }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, result in report.items():
+            if "error" in result:
+                print(f"{name}: error: {result['error']}")
+            else:
+                routes = " ".join(
+                    f"o{int(output):02d}i{input_:02d}"
+                    for output, input_ in result.items()
+                )
+                print(f"{name}: {routes}")
+
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="binary_matrix",
+        description="Query and route Binary Matrix 8x8 HDMI Switchers.",
+    )
+    parser.add_argument("-u", "--username", default=DEFAULT_USERNAME)
+    parser.add_argument(
+        "-p",
+        "--password",
+        default=os.environ.get(ENV_PASSWORD),
+        help=f"login password (default: ${ENV_PASSWORD})",
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="maximum number of matrices contacted at once",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="per-host timeout in seconds",
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("query", help="print the current routing")
+
+    route = subparsers.add_parser("route", help="switch outputs to inputs")
+    route.add_argument(
+        "-r",
+        "--route",
+        type=parse_route,
+        action="append",
+        required=True,
+        metavar="OUTPUT:INPUT",
+    )
+
+    apply = subparsers.add_parser("apply", help="apply a JSON routing file")
+    apply.add_argument("file", type=load_routing_file)
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("hosts", nargs="+", metavar="HOST[:PORT]")
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for ``python -m custom_components.binary_matrix.cli``."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.password is None:
+        parser.error(f"a password is required, pass -p or set ${ENV_PASSWORD}")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    try:
+        args.hosts = [parse_host(host, args.port) for host in args.hosts]
+    except argparse.ArgumentTypeError as err:
+        parser.error(str(err))
+
+    # Per-host failures are already reported on stdout, so the controller's
+    # own error logging is only shown with --verbose.
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.CRITICAL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
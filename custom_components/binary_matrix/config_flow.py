@@ -2,24 +2,34 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import Any, Dict, Optional
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_USERNAME, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
     DOMAIN,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_USERNAME,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_AUTH,
+    ERROR_INVALID_INTERVAL,
     ERROR_UNKNOWN,
 )
 from .matrix_controller import MatrixController, MatrixConnectionError, MatrixAuthError
+from .polling import option_interval
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +38,14 @@ class MatrixConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> MatrixOptionsFlow:
+        """Get the options flow for this handler."""
+        return MatrixOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -82,4 +100,55 @@ class MatrixConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 }
             ),
             errors=errors,
+        )
+
+class MatrixOptionsFlow(config_entries.OptionsFlow):
+    """Handle polling options for Binary Matrix 8x8 HDMI Switcher."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Manage the poll intervals, in seconds."""
+        errors: Dict[str, str] = {}
+
+        if user_input is not None:
+            min_interval = user_input[CONF_MIN_SCAN_INTERVAL]
+            max_interval = user_input[CONF_MAX_SCAN_INTERVAL]
+            if 0 < min_interval <= max_interval:
+                return self.async_create_entry(title="", data=user_input)
+            errors["base"] = ERROR_INVALID_INTERVAL
+
+        options = user_input or self._entry.options
+
+        def _default(key: str, default: timedelta) -> int:
+            return int(option_interval(options, key, default).total_seconds())
+
+        seconds = vol.All(vol.Coerce(int), vol.Range(min=1))
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=_default(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): seconds,
+                    vol.Required(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=_default(
+                            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                        ),
+                    ): seconds,
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=_default(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): seconds,
+                }
+            ),
+            errors=errors,
         )
\ No newline at end of file
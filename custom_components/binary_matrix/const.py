@@ -10,11 +10,17 @@ CONF_PORT = "port"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
 
 # Defaults
 DEFAULT_PORT = 23
 DEFAULT_USERNAME = "admin"
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
+DEFAULT_MIN_SCAN_INTERVAL = timedelta(seconds=5)
+DEFAULT_MAX_SCAN_INTERVAL = timedelta(minutes=5)
+DEFAULT_FAST_POLL_PERIOD = timedelta(minutes=1)
+DEFAULT_POLL_BACKOFF = 2.0
 DEFAULT_TIMEOUT = 10.0
 DEFAULT_RECONNECT_DELAY = 5.0
 
@@ -45,6 +51,7 @@ INPUT_RANGE = range(1, MATRIX_SIZE + 1)
 ERROR_CANNOT_CONNECT = "cannot_connect"
 ERROR_INVALID_AUTH = "invalid_auth"
 ERROR_UNKNOWN = "unknown"
+ERROR_INVALID_INTERVAL = "invalid_interval"
 
 # Debug Flags
 DEBUG_TELNET = True
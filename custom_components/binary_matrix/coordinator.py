@@ -0,0 +1,62 @@
+"""Data update coordinator for Binary Matrix 8x8 HDMI Switcher."""
+from __future__ import annotations
+
+import logging
+from typing import Dict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import DOMAIN
+from .matrix_controller import (
+    MatrixAuthError,
+    MatrixConnectionError,
+    MatrixController,
+)
+from .polling import AdaptivePollInterval
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MatrixCoordinator(DataUpdateCoordinator[Dict[int, int]]):
+    """Coordinator that polls the matrix on an adaptive interval."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        matrix: MatrixController,
+        poll_interval: AdaptivePollInterval,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=poll_interval.interval,
+        )
+        self.matrix = matrix
+        self._poll_interval = poll_interval
+
+    async def _async_update_data(self) -> Dict[int, int]:
+        """Fetch data from the Matrix."""
+        try:
+            state = await self.matrix.update_state()
+        except MatrixConnectionError as err:
+            raise UpdateFailed(f"Connection failed: {err}") from err
+        except MatrixAuthError as err:
+            raise UpdateFailed(f"Authentication failed: {err}") from err
+        except Exception as err:
+            _LOGGER.exception("Error updating matrix state")
+            raise UpdateFailed(f"Unknown error: {err}") from err
+
+        self.update_interval = self._poll_interval.note_state(state)
+        _LOGGER.debug("Next matrix poll in %s", self.update_interval)
+        return state
+
+    async def async_refresh_after_command(self) -> None:
+        """Switch to fast polling and request a refresh after a command."""
+        self.update_interval = self._poll_interval.note_activity()
+        await self.async_request_refresh()
\ No newline at end of file
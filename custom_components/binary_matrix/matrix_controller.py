@@ -36,6 +36,10 @@ class MatrixController:
 
     async def connect(self) -> None:
         """Connect to the matrix and authenticate."""
+        if self._writer:
+            # Reconnecting: release the old socket before opening a new one
+            await self.disconnect()
+
         try:
             _LOGGER.debug("Connecting to %s:%d", self._host, self._port)
 
@@ -88,23 +92,32 @@ class MatrixController:
             # Get initial state
             await self.update_state()
 
-        except Exception as err:
-            _LOGGER.error("Connection failed: %s", err)
-            if self._writer:
-                self._writer.close()
-                await self._writer.wait_closed()
+        except (Exception, asyncio.CancelledError) as err:
+            # Also clean up when cancelled (e.g. by a timeout) mid-login
+            if isinstance(err, asyncio.CancelledError):
+                _LOGGER.debug("Connection to %s cancelled", self._host)
+            else:
+                _LOGGER.error("Connection failed: %s", err)
+            writer = self._writer
             self._reader = None
             self._writer = None
             self._connected = False
+            if writer:
+                try:
+                    writer.close()
+                    await writer.wait_closed()
+                except Exception:
+                    pass
             raise
 
     async def disconnect(self) -> None:
         """Disconnect from the matrix."""
-        if self._connected and self._writer:
-            try:
-                await self._write("q\r\n")
-            except Exception:
-                pass
+        if self._writer:
+            if self._connected:
+                try:
+                    await self._write("q\r\n")
+                except Exception:
+                    pass
             try:
                 self._writer.close()
                 await self._writer.wait_closed()
@@ -129,6 +142,34 @@ class MatrixController:
         await self._send_command(command)
         await self.update_state()
 
+    async def apply_routing(self, routing: Dict[int, int]) -> Dict[int, int]:
+        """Apply an output -> input routing table and return the new state.
+
+        The state is read before switching, so outputs already routed to the
+        requested input are skipped even if the cached state is stale. It is
+        read again once at the end rather than after every switch. Raises
+        ``MatrixError`` if the final state does not match.
+        """
+        for output, input_ in routing.items():
+            if not (1 <= output <= 8 and 1 <= input_ <= 8):
+                raise ValueError("Output and input must be between 1 and 8")
+
+        current = await self.update_state()
+        for output, input_ in sorted(routing.items()):
+            if current.get(output) == input_:
+                continue
+            await self._send_command(f"{output:02d}{input_:02d}")
+
+        state = await self.update_state()
+        missing = [
+            f"o{output:02d}i{input_:02d}"
+            for output, input_ in sorted(routing.items())
+            if state.get(output) != input_
+        ]
+        if missing:
+            raise MatrixError(f"Routes not applied: {' '.join(missing)}")
+        return state
+
     async def _send_command(self, command: str) -> str:
         """Send a command and return the response."""
         if not self._connected:
@@ -13,12 +13,10 @@ from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MATRIX_SIZE
+from .coordinator import MatrixCoordinator
 from .matrix_controller import MatrixController
 
 _LOGGER = logging.getLogger(__name__)
@@ -51,7 +49,7 @@ class MatrixOutputNumber(CoordinatorEntity, NumberEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: MatrixCoordinator,
         matrix: MatrixController,
         output: int,
         entry: ConfigEntry,
@@ -96,7 +94,7 @@ class MatrixOutputNumber(CoordinatorEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the input for this output."""
         await self._matrix.switch_input(self._output, int(value))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_after_command()
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -0,0 +1,89 @@
+"""Adaptive poll interval for Binary Matrix 8x8 HDMI Switchers."""
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .const import DEFAULT_FAST_POLL_PERIOD, DEFAULT_POLL_BACKOFF
+
+
+def option_interval(
+    options: Mapping[str, Any], key: str, default: timedelta
+) -> timedelta:
+    """Return an interval option, stored either as seconds or a timedelta."""
+    value = options.get(key, default)
+    if isinstance(value, timedelta):
+        return value
+    return timedelta(seconds=value)
+
+
+class AdaptivePollInterval:
+    """Poll interval that speeds up on activity and backs off while idle.
+
+    After a command or a routing change the interval drops to ``min_interval``
+    for ``fast_period``. Once that window has passed, every poll that returns
+    an unchanged routing table multiplies the interval by ``backoff`` until it
+    reaches ``max_interval``. The first reading only records the routing, so
+    ``initial_interval`` is the wait after it.
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta,
+        max_interval: timedelta,
+        initial_interval: Optional[timedelta] = None,
+        fast_period: timedelta = DEFAULT_FAST_POLL_PERIOD,
+        backoff: float = DEFAULT_POLL_BACKOFF,
+    ) -> None:
+        """Initialize the poll interval."""
+        if min_interval <= timedelta(0) or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("Backoff must be at least 1")
+        self._min = min_interval.total_seconds()
+        self._max = max_interval.total_seconds()
+        self._fast_period = fast_period.total_seconds()
+        self._backoff = backoff
+        self._interval = self._clamp(
+            (initial_interval or min_interval).total_seconds()
+        )
+        self._fast_until = 0.0
+        self._last_routing: Optional[Tuple[Tuple[int, int], ...]] = None
+
+    def _clamp(self, seconds: float) -> float:
+        """Keep ``seconds`` within the configured bounds."""
+        return max(self._min, min(seconds, self._max))
+
+    def note_activity(self, now: Optional[float] = None) -> timedelta:
+        """Switch to fast polling after a command or detected change."""
+        if now is None:
+            now = time.monotonic()
+        self._fast_until = now + self._fast_period
+        self._interval = self._min
+        return self.interval
+
+    def note_state(
+        self, state: Dict[int, int], now: Optional[float] = None
+    ) -> timedelta:
+        """Record a polled routing table and return the next interval."""
+        if now is None:
+            now = time.monotonic()
+        routing = tuple(sorted(state.items()))
+        if self._last_routing is None:
+            # Nothing to compare against yet, keep the current interval
+            if now < self._fast_until:
+                self._interval = self._min
+        elif routing != self._last_routing:
+            self.note_activity(now)
+        elif now < self._fast_until:
+            self._interval = self._min
+        else:
+            self._interval = self._clamp(self._interval * self._backoff)
+        self._last_routing = routing
+        return self.interval
+
+    @property
+    def interval(self) -> timedelta:
+        """Return the current poll interval."""
+        return timedelta(seconds=self._interval)
\ No newline at end of file
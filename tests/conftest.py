@@ -0,0 +1,115 @@
+"""Shared fixtures for the Binary Matrix tests."""
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+
+import pytest
+
+
+class FakeMatrix:
+    """Minimal telnet server speaking the Binary Matrix 8x8 protocol."""
+
+    def __init__(self, username: str = "admin", password: str = "123") -> None:
+        """Initialize the fake matrix."""
+        self.username = username
+        self.password = password
+        self.routing: Dict[int, int] = {output: output for output in range(1, 9)}
+        self.commands: Deque[str] = deque(maxlen=1000)
+        self.connections = 0
+        self.port = 0
+        self.stall_next = False
+        self.locked_outputs: Set[int] = set()
+        self.banner = b"Telnet Server\r\nLogin: "
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.close()
+            self.drop_connections()
+            await self._server.wait_closed()
+            self._server = None
+
+    @property
+    def open_connections(self) -> int:
+        """Return the number of client connections still open."""
+        return len(self._writers)
+
+    def drop_connections(self) -> None:
+        """Close every open client connection, as a power-cycled matrix would."""
+        for writer in list(self._writers):
+            writer.close()
+
+    def state_map(self) -> str:
+        """Return the STMAP response."""
+        lines = [
+            f"o{output:02d}i{input_:02d}"
+            for output, input_ in sorted(self.routing.items())
+        ]
+        return "STMAP\r\n" + "\r\n".join(lines) + "\r\n>"
+
+    async def _readline(self, reader: asyncio.StreamReader) -> Optional[str]:
+        line = await reader.readline()
+        if not line:
+            return None
+        return line.decode("utf-8", errors="replace").strip()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        stalled = False
+        try:
+            writer.write(self.banner)
+            await writer.drain()
+            username = await self._readline(reader)
+            writer.write(b"Password: ")
+            await writer.drain()
+            password = await self._readline(reader)
+            if username != self.username or password != self.password:
+                writer.write(b"Login incorrect\r\n")
+                await writer.drain()
+                return
+            writer.write(b"Logged in successfully\r\n\r\nPress 'q' to quit\r\n>")
+            await writer.drain()
+
+            while True:
+                command = await self._readline(reader)
+                if command is None or command == "q":
+                    return
+                self.commands.append(command)
+                if self.stall_next or stalled:
+                    # Stop answering on this connection until the client leaves
+                    self.stall_next = False
+                    stalled = True
+                    continue
+                if command == "STMAP":
+                    writer.write(self.state_map().encode())
+                elif len(command) == 4 and command.isdigit():
+                    if int(command[:2]) not in self.locked_outputs:
+                        self.routing[int(command[:2])] = int(command[2:])
+                    writer.write(f"{command}\r\n>".encode())
+                else:
+                    writer.write(b"Unknown command\r\n>")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+@pytest.fixture
+async def fake_matrix(socket_enabled):
+    """Run a fake matrix on a local port for the duration of a test."""
+    matrix = FakeMatrix()
+    await matrix.start()
+    yield matrix
+    await matrix.stop()
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Test the command line tool."""
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from custom_components.binary_matrix import cli
+
+
+async def _main(argv):
+    """Run ``cli.main`` in a worker thread so the fake matrix keeps serving."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, cli.main, argv
+        )
+
+
+def _dead_port():
+    """Return a local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_import_without_home_assistant():
+    """Test the CLI and controller import without pulling in Home Assistant."""
+    code = (
+        "import sys, custom_components.binary_matrix.cli; "
+        "assert not [m for m in sys.modules if m.startswith('homeassistant')]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_parse_host():
+    """Test host and port parsing."""
+    assert cli.parse_host("192.168.4.200", 23) == ("192.168.4.200", 23)
+    assert cli.parse_host("matrix.local:2323", 23) == ("matrix.local", 2323)
+    assert cli.parse_host("::1", 23) == ("::1", 23)
+    assert cli.parse_host("[::1]", 23) == ("::1", 23)
+    assert cli.parse_host("[::1]:2323", 23) == ("::1", 2323)
+    for value in ("[::1", "[::1]2323", "[::1]:port", "[]:23"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            cli.parse_host(value, 23)
+
+
+def test_parse_route():
+    """Test route parsing and validation."""
+    assert cli.parse_route("1:2") == (1, 2)
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.parse_route("9:1")
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.parse_route("one:two")
+
+
+def test_validate_routing():
+    """Test routes must be whole numbers within range."""
+    assert cli.validate_routing({"1": 2, 3: "4"}) == {1: 2, 3: 4}
+    for routing in ({"1": 2.7}, {"1": True}, {"1": None}, {"1": "2.0"}):
+        with pytest.raises(argparse.ArgumentTypeError):
+            cli.validate_routing(routing)
+    with pytest.raises(argparse.ArgumentTypeError, match="Input 9"):
+        cli.validate_routing({"1": 9})
+    with pytest.raises(argparse.ArgumentTypeError, match="Output 0"):
+        cli.validate_routing({"0": 1})
+
+
+def test_load_routing_file(tmp_path):
+    """Test loading a JSON routing file."""
+    path = tmp_path / "routing.json"
+    path.write_text(json.dumps({"1": 2, "3": 4}))
+    assert cli.load_routing_file(str(path)) == {1: 2, 3: 4}
+
+    path.write_text(json.dumps([1, 2]))
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.load_routing_file(str(path))
+
+    path.write_text(json.dumps({}))
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.load_routing_file(str(path))
+
+
+async def test_query(fake_matrix, capsys):
+    """Test querying a matrix."""
+    args = cli.build_parser().parse_args(["-p", "123", "--json", "query", "127.0.0.1"])
+    args.hosts = [("127.0.0.1", fake_matrix.port)]
+
+    assert await cli.run(args) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report[f"127.0.0.1:{fake_matrix.port}"]["1"] == 1
+
+
+async def test_apply_skips_unchanged_outputs(fake_matrix, tmp_path, capsys):
+    """Test applying a routing file only switches outputs that differ."""
+    path = tmp_path / "routing.json"
+    path.write_text(json.dumps({"1": 1, "2": 5}))
+    args = cli.build_parser().parse_args(["-p", "123", "apply", str(path), "127.0.0.1"])
+    args.hosts = [("127.0.0.1", fake_matrix.port)]
+
+    assert await cli.run(args) == 0
+    assert fake_matrix.routing[2] == 5
+    assert "0101" not in fake_matrix.commands
+    assert "0205" in fake_matrix.commands
+    assert "o02i05" in capsys.readouterr().out
+
+
+async def test_unreachable_host(fake_matrix, capsys):
+    """Test an unreachable host is reported without failing the others."""
+    live, dead = f"127.0.0.1:{fake_matrix.port}", f"127.0.0.1:{_dead_port()}"
+
+    assert await _main(["-p", "123", "--json", "query", live, dead]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report[live] == {str(output): output for output in range(1, 9)}
+    assert "error" in report[dead]
+
+
+async def test_main_route(fake_matrix, capsys):
+    """Test routing through the command line entry point."""
+    host = f"127.0.0.1:{fake_matrix.port}"
+
+    assert await _main(["-p", "123", "route", "-r", "1:2", "-r", "4:7", host]) == 0
+    assert fake_matrix.routing[1] == 2
+    assert fake_matrix.routing[4] == 7
+    out = capsys.readouterr().out
+    assert "o01i02" in out and "o04i07" in out
+
+
+async def test_main_route_not_applied(fake_matrix, capsys):
+    """Test a route the matrix ignores is reported as an error."""
+    fake_matrix.locked_outputs.add(4)
+    host = f"127.0.0.1:{fake_matrix.port}"
+
+    assert await _main(["-p", "123", "route", "-r", "1:2", "-r", "4:7", host]) == 1
+    assert "error: Routes not applied: o04i07" in capsys.readouterr().out
+
+
+def test_main_rejects_bad_arguments(monkeypatch):
+    """Test the password and concurrency checks."""
+    monkeypatch.delenv(cli.ENV_PASSWORD, raising=False)
+    with pytest.raises(SystemExit):
+        cli.main(["query", "127.0.0.1"])
+    with pytest.raises(SystemExit):
+        cli.main(["-p", "123", "-c", "0", "query", "127.0.0.1"])
+    with pytest.raises(SystemExit):
+        cli.main(["-p", "123", "query", "127.0.0.1:port"])
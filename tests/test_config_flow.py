@@ -0,0 +1,63 @@
+"""Test the Binary Matrix options flow."""
+import pytest
+from homeassistant import data_entry_flow
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.binary_matrix.const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    DOMAIN,
+    ERROR_INVALID_INTERVAL,
+)
+
+
+@pytest.fixture
+def entry(hass, enable_custom_integrations):
+    """Add a config entry for the matrix."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.4.200", "password": "123"},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def test_options_flow(hass, entry):
+    """Test the poll intervals are saved as options."""
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_SCAN_INTERVAL: 30,
+            CONF_MIN_SCAN_INTERVAL: 2,
+            CONF_MAX_SCAN_INTERVAL: 600,
+        },
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_SCAN_INTERVAL: 30,
+        CONF_MIN_SCAN_INTERVAL: 2,
+        CONF_MAX_SCAN_INTERVAL: 600,
+    }
+
+
+async def test_options_flow_rejects_min_above_max(hass, entry):
+    """Test a minimum interval above the maximum is rejected."""
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_SCAN_INTERVAL: 30,
+            CONF_MIN_SCAN_INTERVAL: 600,
+            CONF_MAX_SCAN_INTERVAL: 60,
+        },
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["errors"] == {"base": ERROR_INVALID_INTERVAL}
+    assert entry.options == {}
\ No newline at end of file
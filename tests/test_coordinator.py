@@ -0,0 +1,91 @@
+"""Test the adaptive polling coordinator."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.binary_matrix.coordinator import MatrixCoordinator
+from custom_components.binary_matrix.matrix_controller import MatrixConnectionError
+from custom_components.binary_matrix.polling import AdaptivePollInterval
+
+ROUTING = {output: output for output in range(1, 9)}
+
+
+@pytest.fixture
+def matrix():
+    """Create a mock matrix controller."""
+    matrix = MagicMock()
+    matrix.update_state = AsyncMock(return_value=ROUTING)
+    return matrix
+
+
+@pytest.fixture
+async def coordinator(hass, matrix):
+    """Create a coordinator polling between 5 seconds and 5 minutes."""
+    coordinator = MatrixCoordinator(
+        hass,
+        matrix,
+        AdaptivePollInterval(
+            min_interval=timedelta(seconds=5),
+            max_interval=timedelta(minutes=5),
+            initial_interval=timedelta(seconds=30),
+        ),
+    )
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+async def test_first_refresh_keeps_initial_interval(coordinator):
+    """Test the first poll waits the initial interval before the next one."""
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+async def test_stable_poll_backs_off(coordinator):
+    """Test unchanged routing doubles the update interval."""
+    await coordinator.async_refresh()
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=120)
+
+
+async def test_drift_polls_fast(coordinator, matrix):
+    """Test a routing change seen while polling drops to the minimum."""
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    matrix.update_state.return_value = {**ROUTING, 1: 2}
+    await coordinator.async_refresh()
+
+    assert coordinator.data[1] == 2
+    assert coordinator.update_interval == timedelta(seconds=5)
+
+
+async def test_refresh_after_command_polls_fast(coordinator, matrix):
+    """Test a command switches to the minimum interval and refreshes."""
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    matrix.update_state.reset_mock()
+
+    await coordinator.async_refresh_after_command()
+
+    matrix.update_state.assert_awaited_once()
+    assert coordinator.update_interval == timedelta(seconds=5)
+
+
+async def test_update_failed_keeps_interval(coordinator, matrix):
+    """Test a failed poll leaves the interval unchanged."""
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    matrix.update_state.side_effect = MatrixConnectionError("gone")
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is False
+    assert coordinator.update_interval == timedelta(seconds=60)
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""Test the Binary Matrix integration setup."""
+from homeassistant.config_entries import ConfigEntryState
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.binary_matrix.const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    DOMAIN,
+)
+
+
+async def test_setup_invalid_poll_options(hass, enable_custom_integrations):
+    """Test invalid poll intervals fail setup instead of retrying."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.4.200", "password": "123"},
+        options={CONF_MIN_SCAN_INTERVAL: 600, CONF_MAX_SCAN_INTERVAL: 60},
+    )
+    entry.add_to_hass(hass)
+
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.SETUP_ERROR
\ No newline at end of file
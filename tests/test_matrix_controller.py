@@ -1,10 +1,13 @@
 """Test the matrix controller."""
+import asyncio
+import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from custom_components.binary_matrix.matrix_controller import (
     MatrixController,
     MatrixConnectionError,
     MatrixAuthError,
+    MatrixError,
 )
 
 @pytest.fixture
@@ -118,4 +121,111 @@ async def test_disconnect(matrix, mock_telnet):
     
     assert matrix.connected is False
     writer.close.assert_called_once()
-    writer.wait_closed.assert_called_once()
\ No newline at end of file
+    writer.wait_closed.assert_called_once()
+
+def _local_matrix(fake_matrix, password="123"):
+    """Create a controller for the fake matrix."""
+    return MatrixController(
+        host="127.0.0.1",
+        port=fake_matrix.port,
+        username="admin",
+        password=password,
+    )
+
+async def _wait_for_connections(fake_matrix, count):
+    """Wait for the fake matrix to see its clients leave."""
+    for _ in range(100):
+        if fake_matrix.open_connections == count:
+            return
+        await asyncio.sleep(0.01)
+    assert fake_matrix.open_connections == count
+
+async def test_cancelled_connect_closes_connection(fake_matrix, caplog):
+    """Test a connect cancelled mid-login releases the socket quietly."""
+    matrix = _local_matrix(fake_matrix)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(matrix.connect(), 0.1)
+
+    assert matrix._writer is None
+    assert matrix.connected is False
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+    await _wait_for_connections(fake_matrix, 0)
+
+async def test_reconnect_closes_previous_connection(fake_matrix):
+    """Test connecting twice leaves a single open connection."""
+    matrix = _local_matrix(fake_matrix)
+
+    await matrix.connect()
+    first_writer = matrix._writer
+    await matrix.connect()
+
+    assert first_writer.is_closing()
+    assert fake_matrix.connections == 2
+    await _wait_for_connections(fake_matrix, 1)
+    await matrix.disconnect()
+    await _wait_for_connections(fake_matrix, 0)
+
+async def test_disconnect_after_failed_login(fake_matrix):
+    """Test disconnect closes the socket after a failed login."""
+    matrix = _local_matrix(fake_matrix, password="wrong")
+
+    with pytest.raises(MatrixAuthError):
+        await matrix.connect()
+    await matrix.disconnect()
+
+    assert matrix._writer is None
+    await _wait_for_connections(fake_matrix, 0)
+
+async def test_disconnect_during_login(fake_matrix):
+    """Test disconnect closes a writer whose login has not finished."""
+    matrix = _local_matrix(fake_matrix)
+    connect = asyncio.create_task(matrix.connect())
+    while matrix._writer is None:
+        await asyncio.sleep(0.01)
+    writer = matrix._writer
+
+    await matrix.disconnect()
+
+    assert writer.is_closing()
+    assert matrix._writer is None
+    with pytest.raises(MatrixError):
+        await connect
+    await _wait_for_connections(fake_matrix, 0)
+
+@pytest.mark.parametrize(
+    ("password", "banner", "error"),
+    [
+        ("wrong", b"Login: ", MatrixAuthError),
+        ("123", b"Busy\r\n", MatrixConnectionError),
+    ],
+)
+async def test_wait_closed_error_keeps_original_error(
+    fake_matrix, monkeypatch, password, banner, error
+):
+    """Test a failing wait_closed does not hide why the login failed."""
+    fake_matrix.banner = banner
+    monkeypatch.setattr(
+        asyncio.StreamWriter,
+        "wait_closed",
+        AsyncMock(side_effect=ConnectionResetError),
+    )
+    matrix = _local_matrix(fake_matrix, password=password)
+
+    with pytest.raises(error):
+        await matrix.connect()
+
+    assert matrix._writer is None
+
+async def test_apply_routing_refreshes_stale_state(fake_matrix):
+    """Test apply_routing switches outputs changed since the last poll."""
+    matrix = _local_matrix(fake_matrix)
+    await matrix.connect()
+    fake_matrix.routing[2] = 5  # Changed at the front panel
+
+    state = await matrix.apply_routing({1: 1, 2: 2})
+
+    assert state[2] == 2
+    assert "0202" in fake_matrix.commands
+    assert "0101" not in fake_matrix.commands
+    await matrix.disconnect()
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""Test the adaptive poll interval."""
+from datetime import timedelta
+
+import pytest
+
+from custom_components.binary_matrix.polling import (
+    AdaptivePollInterval,
+    option_interval,
+)
+
+ROUTING = {output: output for output in range(1, 9)}
+
+
+@pytest.fixture
+def poll_interval():
+    """Create a poll interval between 5 seconds and 5 minutes."""
+    return AdaptivePollInterval(
+        min_interval=timedelta(seconds=5),
+        max_interval=timedelta(minutes=5),
+        initial_interval=timedelta(seconds=30),
+        fast_period=timedelta(minutes=1),
+    )
+
+
+def test_backs_off_while_unchanged(poll_interval):
+    """Test the interval doubles up to the maximum while routing is stable."""
+    intervals = [poll_interval.note_state(ROUTING, now=0).total_seconds()]
+    for _ in range(5):
+        intervals.append(poll_interval.note_state(ROUTING, now=0).total_seconds())
+
+    assert intervals == [30, 60, 120, 240, 300, 300]
+
+
+def test_activity_polls_fast_then_backs_off(poll_interval):
+    """Test a command polls at the minimum for the fast period."""
+    poll_interval.note_state(ROUTING, now=0)
+
+    assert poll_interval.note_activity(now=100) == timedelta(seconds=5)
+    assert poll_interval.note_state(ROUTING, now=130) == timedelta(seconds=5)
+    assert poll_interval.note_state(ROUTING, now=160) == timedelta(seconds=10)
+    assert poll_interval.note_state(ROUTING, now=170) == timedelta(seconds=20)
+
+
+def test_drift_polls_fast(poll_interval):
+    """Test a routing change seen while polling counts as activity."""
+    for _ in range(5):
+        poll_interval.note_state(ROUTING, now=0)
+    assert poll_interval.interval == timedelta(minutes=5)
+
+    drifted = {**ROUTING, 1: 2}
+    assert poll_interval.note_state(drifted, now=1000) == timedelta(seconds=5)
+    assert poll_interval.note_state(drifted, now=1030) == timedelta(seconds=5)
+
+
+def test_initial_interval_is_clamped():
+    """Test the initial interval is kept within the bounds."""
+    poll_interval = AdaptivePollInterval(
+        min_interval=timedelta(seconds=5),
+        max_interval=timedelta(seconds=20),
+        initial_interval=timedelta(seconds=30),
+    )
+
+    assert poll_interval.interval == timedelta(seconds=20)
+
+
+def test_invalid_bounds():
+    """Test a minimum above the maximum is rejected."""
+    with pytest.raises(ValueError):
+        AdaptivePollInterval(
+            min_interval=timedelta(minutes=5),
+            max_interval=timedelta(seconds=5),
+        )
+
+
+def test_first_reading_keeps_initial_interval(poll_interval):
+    """Test the first reading only records the routing."""
+    assert poll_interval.note_state(ROUTING, now=0) == timedelta(seconds=30)
+    assert poll_interval.note_state({**ROUTING, 1: 2}, now=1) == timedelta(seconds=5)
+
+
+def test_option_interval():
+    """Test interval options stored as seconds or timedeltas."""
+    default = timedelta(seconds=30)
+    assert option_interval({}, "scan_interval", default) == default
+    assert option_interval({"scan_interval": 10}, "scan_interval", default) == (
+        timedelta(seconds=10)
+    )
+    assert option_interval(
+        {"scan_interval": timedelta(minutes=1)}, "scan_interval", default
+    ) == timedelta(minutes=1)
\ No newline at end of file
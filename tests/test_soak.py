@@ -0,0 +1,218 @@
+"""Soak test the matrix controller against a fake device.
+
+Runs random traffic, including dropped connections, stalled responses, command
+timeouts and reconnects, and fails if RSS, traced Python memory, open file
+descriptors or pending asyncio tasks grow over the run.
+
+Skipped unless ``BINARY_MATRIX_SOAK_SECONDS`` is set, e.g.::
+
+    BINARY_MATRIX_SOAK_SECONDS=14400 pytest tests/test_soak.py -m soak
+"""
+import asyncio
+import gc
+import logging
+import os
+import random
+import time
+import tracemalloc
+from collections import deque
+from typing import List, NamedTuple, Optional
+
+import pytest
+
+from custom_components.binary_matrix import matrix_controller
+from custom_components.binary_matrix.matrix_controller import (
+    MatrixController,
+    MatrixError,
+)
+
+SOAK_SECONDS = float(os.environ.get("BINARY_MATRIX_SOAK_SECONDS", "0"))
+SAMPLE_SECONDS = float(os.environ.get("BINARY_MATRIX_SOAK_SAMPLE_SECONDS", "60"))
+SEED = int(os.environ.get("BINARY_MATRIX_SOAK_SEED", "0"))
+
+WARMUP_SECONDS = min(30.0, SOAK_SECONDS / 10)
+OPERATION_TIMEOUT = 10.0
+RSS_GROWTH_LIMIT = 8 * 1024 * 1024
+TRACED_GROWTH_LIMIT = 1024 * 1024
+# A one-off ramp after warmup levels off, a leak keeps growing, so the second
+# half of the run gets a tighter budget than the run as a whole.
+RSS_TREND_LIMIT = 2 * 1024 * 1024
+TRACED_TREND_LIMIT = 256 * 1024
+
+pytestmark = [
+    pytest.mark.soak,
+    pytest.mark.skipif(
+        not SOAK_SECONDS, reason="set BINARY_MATRIX_SOAK_SECONDS to run"
+    ),
+]
+
+
+class ResourceSample(NamedTuple):
+    """Process resources at one point in the run."""
+
+    elapsed: float
+    rss: Optional[int]
+    traced: int
+    fds: Optional[int]
+    tasks: int
+
+
+def _rss_bytes() -> Optional[int]:
+    """Return the resident set size, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            pages = int(file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _open_fds() -> Optional[int]:
+    """Return the number of open file descriptors, if the OS exposes them."""
+    for path in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(path))
+        except OSError:
+            continue
+    return None
+
+
+def _sample(start: float) -> ResourceSample:
+    """Collect garbage and measure the current resources."""
+    gc.collect()
+    return ResourceSample(
+        elapsed=time.monotonic() - start,
+        rss=_rss_bytes(),
+        traced=tracemalloc.get_traced_memory()[0],
+        fds=_open_fds(),
+        tasks=len(asyncio.all_tasks()),
+    )
+
+
+async def _reconnect(matrix: MatrixController, fake_matrix) -> None:
+    """Reconnect after a failure, retrying until the fake device answers."""
+    while True:
+        fake_matrix.stall_next = False
+        try:
+            await asyncio.wait_for(matrix.connect(), OPERATION_TIMEOUT)
+            return
+        except (MatrixError, OSError, asyncio.TimeoutError):
+            await asyncio.sleep(0.1)
+
+
+async def _step(matrix: MatrixController, fake_matrix, rng: random.Random) -> bool:
+    """Run one random operation and return False if the connection broke."""
+    roll = rng.random()
+    try:
+        if roll < 0.05:
+            fake_matrix.drop_connections()
+            await matrix.update_state()
+        elif roll < 0.10:
+            fake_matrix.stall_next = True
+            await matrix.update_state()
+        elif roll < 0.13:
+            # Cancel a login half way through, as a caller's timeout would
+            await asyncio.wait_for(matrix.connect(), rng.uniform(0.05, 1.5))
+        elif roll < 0.15:
+            await matrix.disconnect()
+            return False
+        elif roll < 0.45:
+            output, input_ = rng.randint(1, 8), rng.randint(1, 8)
+            await asyncio.wait_for(
+                matrix.switch_input(output, input_), OPERATION_TIMEOUT
+            )
+        else:
+            await asyncio.wait_for(matrix.update_state(), OPERATION_TIMEOUT)
+    except (MatrixError, OSError, asyncio.TimeoutError):
+        return False
+    return matrix.connected and matrix.state == fake_matrix.routing
+
+
+def _growth_report(samples: List[ResourceSample]) -> List[str]:
+    """Return a description of every resource that grew after warmup."""
+    baseline, middle, final = samples[0], samples[len(samples) // 2], samples[-1]
+    problems = []
+    if baseline.fds is not None and final.fds > baseline.fds:
+        problems.append(f"open fds grew from {baseline.fds} to {final.fds}")
+    if final.tasks > baseline.tasks:
+        problems.append(f"pending tasks grew from {baseline.tasks} to {final.tasks}")
+    if baseline.rss is not None and final.rss - baseline.rss > RSS_GROWTH_LIMIT:
+        problems.append(f"RSS grew by {(final.rss - baseline.rss) / 1024:.0f} KiB")
+    if final.traced - baseline.traced > TRACED_GROWTH_LIMIT:
+        problems.append(
+            f"traced memory grew by {(final.traced - baseline.traced) / 1024:.0f} KiB"
+        )
+    if middle.rss is not None and final.rss - middle.rss > RSS_TREND_LIMIT:
+        problems.append(
+            f"RSS grew by {(final.rss - middle.rss) / 1024:.0f} KiB "
+            "in the second half of the run"
+        )
+    if final.traced - middle.traced > TRACED_TREND_LIMIT:
+        problems.append(
+            f"traced memory grew by {(final.traced - middle.traced) / 1024:.0f} KiB "
+            "in the second half of the run"
+        )
+    return problems
+
+
+@pytest.mark.serial
+async def test_soak(fake_matrix, monkeypatch):
+    """Test long-running traffic does not leak memory, fds or tasks."""
+    # pytest keeps captured log records, and the exceptions they reference,
+    # for the report; keep the controller's logging out of that buffer.
+    logger = logging.getLogger(matrix_controller.__name__)
+    monkeypatch.setattr(logger, "propagate", False)
+    monkeypatch.setattr(logger, "handlers", [logging.NullHandler()])
+    # The fake device runs in this process; don't let its command log count
+    # against the controller's memory budget.
+    fake_matrix.commands = deque(maxlen=0)
+
+    rng = random.Random(SEED)
+    matrix = MatrixController(
+        host="127.0.0.1",
+        port=fake_matrix.port,
+        username=fake_matrix.username,
+        password=fake_matrix.password,
+    )
+
+    tracemalloc.start(25)
+    try:
+        start = time.monotonic()
+        await _reconnect(matrix, fake_matrix)
+
+        samples: List[ResourceSample] = []
+        baseline_snapshot = None
+        next_sample = start + WARMUP_SECONDS
+        operations = reconnects = 0
+
+        while time.monotonic() - start < SOAK_SECONDS:
+            operations += 1
+            if not await _step(matrix, fake_matrix, rng):
+                reconnects += 1
+                await _reconnect(matrix, fake_matrix)
+
+            if time.monotonic() >= next_sample:
+                samples.append(_sample(start))
+                if baseline_snapshot is None:
+                    baseline_snapshot = tracemalloc.take_snapshot()
+                next_sample = time.monotonic() + SAMPLE_SECONDS
+
+        # Measure while connected, matching the state of the warmup sample
+        samples.append(_sample(start))
+        problems = _growth_report(samples)
+        if problems and baseline_snapshot is not None:
+            stats = tracemalloc.take_snapshot().compare_to(baseline_snapshot, "lineno")
+            problems.extend(f"  {stat}" for stat in stats[:10])
+    finally:
+        tracemalloc.stop()
+        await matrix.disconnect()
+
+    print(
+        f"soak: {operations} operations, {reconnects} reconnects, "
+        f"{fake_matrix.connections} connections in {samples[-1].elapsed:.0f}s"
+    )
+    for sample in samples:
+        print(f"soak: {sample}")
+
+    assert reconnects, "soak run too short to exercise reconnects"
+    assert not problems, "\n".join(problems)
\ No newline at end of file